@@ -11,6 +11,7 @@ load_dotenv()
 logger = setup_logging()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+HOT_ARTICLE_LOOKUP_TIMEOUT_SECONDS = 1
 
 engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -52,4 +53,96 @@ async def log_search(
         finally:
             await conn.close()
     except Exception as e:
-        logger.error(f"Error inserting search log for request_id: {request_id}. Error: {str(e)}", extra={"request_id": request_id})
\ No newline at end of file
+        logger.error(f"Error inserting search log for request_id: {request_id}. Error: {str(e)}", extra={"request_id": request_id})
+
+async def ensure_hot_articles_table():
+    logger.info("Ensuring hot_articles table exists", extra={"request_id": "N/A"})
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        await conn.execute('''
+            CREATE TABLE IF NOT EXISTS hot_articles (
+                pmc_id VARCHAR PRIMARY KEY,
+                body_text TEXT,
+                citation_result JSONB,
+                hit_count INTEGER,
+                refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+    finally:
+        await conn.close()
+
+async def get_frequent_pmc_ids(limit: int, window_days: int, fresh_seconds: int) -> List[dict]:
+    logger.info(f"Mining searches for the {limit} most frequent PMC IDs over the last {window_days} days", extra={"request_id": "N/A"})
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        rows = await conn.fetch('''
+            WITH frequent AS (
+                SELECT pmc_id, COUNT(*) AS hit_count
+                FROM searches, jsonb_array_elements_text(processed_pmc_ids) AS pmc_id
+                WHERE timestamp > CURRENT_TIMESTAMP - make_interval(days => $2)
+                GROUP BY pmc_id
+                ORDER BY hit_count DESC
+                LIMIT $1
+            )
+            SELECT frequent.pmc_id, frequent.hit_count,
+                COALESCE(hot_articles.refreshed_at > CURRENT_TIMESTAMP - make_interval(secs => $3), FALSE) AS is_fresh
+            FROM frequent
+            LEFT JOIN hot_articles ON hot_articles.pmc_id = frequent.pmc_id
+        ''', limit, window_days, fresh_seconds)
+        return [{"pmc_id": row["pmc_id"], "hit_count": row["hit_count"], "is_fresh": row["is_fresh"]} for row in rows]
+    finally:
+        await conn.close()
+
+async def upsert_hot_article(pmc_id: str, body_text: str, citation_result: dict, hit_count: int):
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        await conn.execute('''
+            INSERT INTO hot_articles (pmc_id, body_text, citation_result, hit_count, refreshed_at)
+            VALUES ($1, $2, $3, $4, CURRENT_TIMESTAMP)
+            ON CONFLICT (pmc_id) DO UPDATE SET
+                body_text = EXCLUDED.body_text,
+                citation_result = EXCLUDED.citation_result,
+                hit_count = EXCLUDED.hit_count,
+                refreshed_at = EXCLUDED.refreshed_at
+        ''', pmc_id, body_text, json.dumps(citation_result), hit_count)
+        logger.debug(f"Hot article upserted for PMC ID: {pmc_id}", extra={"request_id": "N/A"})
+    finally:
+        await conn.close()
+
+async def delete_stale_hot_articles(pmc_ids: List[str], max_age_seconds: int):
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        result = await conn.execute('''
+            DELETE FROM hot_articles
+            WHERE NOT (pmc_id = ANY($1::varchar[]))
+                OR refreshed_at < CURRENT_TIMESTAMP - make_interval(secs => $2)
+        ''', pmc_ids, max_age_seconds)
+        logger.info(f"Pruned stale hot articles: {result}", extra={"request_id": "N/A"})
+    finally:
+        await conn.close()
+
+async def get_hot_articles(pmc_ids: List[str], max_age_seconds: int, request_id: str) -> dict:
+    if not pmc_ids:
+        return {}
+    try:
+        conn = await asyncpg.connect(DATABASE_URL, timeout=HOT_ARTICLE_LOOKUP_TIMEOUT_SECONDS)
+        try:
+            rows = await conn.fetch('''
+                SELECT pmc_id, body_text, citation_result
+                FROM hot_articles
+                WHERE pmc_id = ANY($1::varchar[])
+                    AND refreshed_at > CURRENT_TIMESTAMP - make_interval(secs => $2)
+            ''', pmc_ids, max_age_seconds, timeout=HOT_ARTICLE_LOOKUP_TIMEOUT_SECONDS)
+        finally:
+            await conn.close(timeout=HOT_ARTICLE_LOOKUP_TIMEOUT_SECONDS)
+        logger.info(f"Found {len(rows)} of {len(pmc_ids)} PMC IDs in hot_articles", extra={"request_id": request_id})
+        return {
+            row["pmc_id"]: {
+                "body_text": row["body_text"],
+                "citation_result": json.loads(row["citation_result"]),
+            }
+            for row in rows
+        }
+    except Exception as e:
+        logger.error(f"Error reading hot_articles, falling back to live fetch. Error: {type(e).__name__}: {str(e)}", extra={"request_id": request_id})
+        return {}
@@ -0,0 +1,84 @@
+import os
+import asyncio
+import logging
+import aiohttp
+from dotenv import load_dotenv
+from database import ensure_hot_articles_table, get_frequent_pmc_ids, upsert_hot_article, delete_stale_hot_articles, get_hot_articles
+from search_service import fetch_article_content, parse_article, compact_body_text
+from citation_service import generate_citations
+
+load_dotenv()
+
+logger = logging.getLogger("citation_app")
+
+HOT_ARTICLE_LIMIT = int(os.getenv("HOT_ARTICLE_LIMIT", "300"))
+HOT_ARTICLE_WINDOW_DAYS = int(os.getenv("HOT_ARTICLE_WINDOW_DAYS", "30"))
+HOT_ARTICLE_REFRESH_INTERVAL_SECONDS = int(os.getenv("HOT_ARTICLE_REFRESH_INTERVAL_SECONDS", "86400"))
+
+if HOT_ARTICLE_WINDOW_DAYS <= 0:
+    raise ValueError(f"HOT_ARTICLE_WINDOW_DAYS must be positive, got {HOT_ARTICLE_WINDOW_DAYS}")
+if HOT_ARTICLE_REFRESH_INTERVAL_SECONDS <= 0:
+    raise ValueError(f"HOT_ARTICLE_REFRESH_INTERVAL_SECONDS must be positive, got {HOT_ARTICLE_REFRESH_INTERVAL_SECONDS}; set HOT_ARTICLE_LIMIT=0 to disable the job")
+
+HOT_ARTICLE_MAX_AGE_SECONDS = 2 * HOT_ARTICLE_REFRESH_INTERVAL_SECONDS
+HOT_ARTICLE_CONCURRENCY = 5
+HOT_ARTICLES_ENABLED = HOT_ARTICLE_LIMIT > 0
+
+async def get_precomputed_articles(pmc_ids, request_id):
+    if not HOT_ARTICLES_ENABLED:
+        return {}
+    return await get_hot_articles(pmc_ids, HOT_ARTICLE_MAX_AGE_SECONDS, request_id)
+
+def prepare_hot_article(article_content, pmc_id, request_id):
+    article = parse_article(article_content, pmc_id, request_id)
+    if not article:
+        return None
+    front, body = article
+    return front.prettify(), compact_body_text(body)
+
+async def precompute_hot_article(session, semaphore, pmc_id, hit_count, guide_content, request_id):
+    async with semaphore:
+        try:
+            article_content = await fetch_article_content(session, pmc_id, request_id)
+            article = await asyncio.to_thread(prepare_hot_article, article_content, pmc_id, request_id)
+            if not article:
+                return False
+            front_xml, body_text = article
+
+            citation_result = await generate_citations(front_xml, guide_content, request_id)
+            if not citation_result["success"]:
+                logger.warning(f"Citation generation failed for hot PMC ID: {pmc_id}", extra={"request_id": request_id})
+                return False
+
+            await upsert_hot_article(pmc_id, body_text, citation_result, hit_count)
+            return True
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching data for hot PMC ID {pmc_id}: {str(e)}", extra={"request_id": request_id})
+        except Exception as e:
+            logger.error(f"Unexpected error precomputing hot PMC ID {pmc_id}: {str(e)}", extra={"request_id": request_id})
+        return False
+
+async def refresh_hot_articles(guide_content: str):
+    request_id = "hot_article_refresh"
+    logger.info("Refreshing hot article store", extra={"request_id": request_id})
+    await ensure_hot_articles_table()
+    frequent = await get_frequent_pmc_ids(HOT_ARTICLE_LIMIT, HOT_ARTICLE_WINDOW_DAYS, HOT_ARTICLE_REFRESH_INTERVAL_SECONDS)
+    stale = [row for row in frequent if not row["is_fresh"]]
+    logger.info(f"{len(frequent) - len(stale)} of {len(frequent)} hot articles are still fresh", extra={"request_id": request_id})
+
+    semaphore = asyncio.Semaphore(HOT_ARTICLE_CONCURRENCY)
+    async with aiohttp.ClientSession() as session:
+        tasks = [precompute_hot_article(session, semaphore, row["pmc_id"], row["hit_count"], guide_content, request_id)
+                 for row in stale]
+        results = await asyncio.gather(*tasks)
+
+    await delete_stale_hot_articles([row["pmc_id"] for row in frequent], HOT_ARTICLE_MAX_AGE_SECONDS)
+    logger.info(f"Refreshed {sum(results)} of {len(stale)} stale hot articles", extra={"request_id": request_id})
+
+async def run_hot_article_refresh_loop(guide_content: str):
+    while True:
+        try:
+            await refresh_hot_articles(guide_content)
+        except Exception as e:
+            logger.error(f"Hot article refresh failed: {str(e)}", extra={"request_id": "hot_article_refresh"})
+        await asyncio.sleep(HOT_ARTICLE_REFRESH_INTERVAL_SECONDS)
@@ -11,6 +11,7 @@ import time
 import json
 import asyncio
 import aiohttp
+from contextlib import asynccontextmanager, suppress
 
 from models import CitationRequest, CitationResponse, Citation
 from database import log_search
@@ -18,10 +19,29 @@ from logging_config import setup_logging
 from utils import load_file_content
 from citation_service import generate_citations, check_relevance, validate_biomedical_text
 from search_service import build_google_search_url, process_search_result
+from hot_article_service import run_hot_article_refresh_loop, get_precomputed_articles, HOT_ARTICLES_ENABLED
 
 load_dotenv()
 
-app = FastAPI()
+logger = setup_logging()
+
+OU_HARVARD_CTR_GUIDE_PATH = "ou_harvard_cite_them_right_guide.md"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if not HOT_ARTICLES_ENABLED:
+        logger.info("Hot article refresh disabled", extra={"request_id": "N/A"})
+        yield
+        return
+
+    guide_content = load_file_content(OU_HARVARD_CTR_GUIDE_PATH)
+    hot_article_refresh_task = asyncio.create_task(run_hot_article_refresh_loop(guide_content))
+    yield
+    hot_article_refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await hot_article_refresh_task
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -31,10 +51,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-logger = setup_logging()
-
-OU_HARVARD_CTR_GUIDE_PATH = "ou_harvard_cite_them_right_guide.md"
-
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     request_id = getattr(request.state, 'request_id', 'N/A')
@@ -83,9 +99,10 @@ async def find_citations_for_passage(request: CitationRequest, background_tasks:
 
         found_pmc_ids = [extract_pmc_id(item["link"]) for item in search_data.get("items", [])]
         found_pmc_ids = [pmc_id for pmc_id in found_pmc_ids if pmc_id]
+        hot_articles = await get_precomputed_articles(found_pmc_ids, request_id)
 
         async with aiohttp.ClientSession() as session:
-            tasks = [process_search_result(session, item, guide_content, request.text, request_id) 
+            tasks = [process_search_result(session, item, guide_content, request.text, request_id, hot_articles) 
                      for item in search_data.get("items", [])[:10]]
             results = await asyncio.gather(*tasks)
 
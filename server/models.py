@@ -1,6 +1,6 @@
 from typing import List, Optional
 from pydantic import BaseModel, Field, validator
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Float
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Float, Text, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
@@ -52,5 +52,14 @@ class SearchLog(Base):
     relevance_check_results = Column(JSONB)
     final_citations = Column(JSONB)
 
+class HotArticle(Base):
+    __tablename__ = "hot_articles"
+
+    pmc_id = Column(String, primary_key=True)
+    body_text = Column(Text)
+    citation_result = Column(JSONB)
+    hit_count = Column(Integer)
+    refreshed_at = Column(DateTime, server_default=func.current_timestamp())
+
 MAX_WORD_COUNT = 300
 MIN_WORD_COUNT = 5
\ No newline at end of file
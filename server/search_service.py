@@ -42,7 +42,36 @@ def build_pubmed_url(pmc_id: str) -> str:
     logger.debug(f"PubMed URL: {url}", extra={"request_id": "N/A"})
     return url
 
-async def process_search_result(session, item, guide_content, request_text, request_id):
+async def fetch_article_content(session, pmc_id, request_id):
+    article_url = build_pubmed_url(pmc_id)
+    logger.info(f"Fetching article content from PubMed: {article_url}", extra={"request_id": request_id})
+    async with session.get(article_url) as response:
+        response.raise_for_status()
+        return await response.text()
+
+def parse_article(article_content, pmc_id, request_id):
+    soup = BeautifulSoup(article_content, 'xml')
+    front = soup.find('front')
+    body = soup.find('body')
+
+    if not front: 
+        logger.warning(f"Missing front for PMC ID: {pmc_id}", extra={"request_id": request_id})
+        return None
+
+    if not body:
+        logger.warning(f"Missing body for PMC ID: {pmc_id}", extra={"request_id": request_id})
+        return None
+
+    return front, body
+
+async def fetch_article(session, pmc_id, request_id):
+    article_content = await fetch_article_content(session, pmc_id, request_id)
+    return parse_article(article_content, pmc_id, request_id)
+
+def compact_body_text(body) -> str:
+    return " ".join(body.get_text(" ", strip=True).split())
+
+async def process_search_result(session, item, guide_content, request_text, request_id, hot_articles=None):
     logger.info(f"Processing search result: {item['link']}", extra={"request_id": request_id})
     pmc_id = extract_pmc_id(item["link"])
     if not pmc_id:
@@ -50,26 +79,19 @@ async def process_search_result(session, item, guide_content, request_text, requ
         return None
 
     try:
-        article_url = build_pubmed_url(pmc_id)
-        logger.info(f"Fetching article content from PubMed: {article_url}", extra={"request_id": request_id})
-        async with session.get(article_url) as response:
-            response.raise_for_status()
-            article_content = await response.text()
-        
-        soup = BeautifulSoup(article_content, 'xml')
-        front = soup.find('front')
-        body = soup.find('body')
-
-        if not front: 
-            logger.warning(f"Missing front for PMC ID: {pmc_id}", extra={"request_id": request_id})
-            return None
-        
-        if not body:
-            logger.warning(f"Missing body for PMC ID: {pmc_id}", extra={"request_id": request_id})
-            return None
+        hot_article = (hot_articles or {}).get(pmc_id)
+        if hot_article:
+            logger.info(f"Using precomputed citation for PMC ID: {pmc_id}", extra={"request_id": request_id})
+            citation_result = hot_article["citation_result"]
+            relevance_result = await check_relevance(request_text, hot_article["body_text"], request_id)
+        else:
+            article = await fetch_article(session, pmc_id, request_id)
+            if not article:
+                return None
+            front, body = article
 
-        citation_result = await generate_citations(front.prettify(), guide_content, request_id)
-        relevance_result = await check_relevance(request_text, body.prettify(), request_id)
+            citation_result = await generate_citations(front.prettify(), guide_content, request_id)
+            relevance_result = await check_relevance(request_text, compact_body_text(body), request_id)
 
         if not citation_result["success"] or not relevance_result["found_relevant_passage"]:
             logger.warning(f"Citation generation failed or no relevant passage found for PMC ID: {pmc_id}", extra={"request_id": request_id})